@@ -0,0 +1,106 @@
+import argparse
+import importlib.util
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Dict, Any
+
+ENTRY_POINTS = [
+    "parallel_ai_testing.main",
+    "comprehensive_test",
+    "example_custom_run",
+]
+
+HEAVY_MODULES = [
+    "parallel",
+    "dotenv",
+    "lucene_query_parser",
+    "aiohttp",
+]
+
+REPO_ROOT = Path(__file__).resolve().parent
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+
+def measure_entry_point(module: str) -> Dict[str, Any]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True
+    )
+    timings = parse_importtime(proc.stderr)
+    error = None
+    if proc.returncode:
+        stderr_lines = proc.stderr.strip().splitlines()
+        error = stderr_lines[-1] if stderr_lines else f"exit code {proc.returncode}"
+
+    return {
+        "ok": proc.returncode == 0,
+        "cumulative_us": timings.get(module),
+        "heavy_imports": [m for m in HEAVY_MODULES if m in timings],
+        "error": error
+    }
+
+
+def find_missing_modules() -> List[str]:
+    return [m for m in HEAVY_MODULES if importlib.util.find_spec(m) is None]
+
+
+def run_benchmark(entry_points: List[str], runs: int) -> Dict[str, Any]:
+    missing = find_missing_modules()
+    report = {}
+    for module in entry_points:
+        samples = [measure_entry_point(module) for _ in range(runs)]
+        timings = [s["cumulative_us"] for s in samples if s["cumulative_us"] is not None]
+        heavy_imports = sorted({m for s in samples for m in s["heavy_imports"]})
+        errors = [s["error"] for s in samples if s["error"]]
+
+        report[module] = {
+            "runs": runs,
+            "failed_runs": sum(1 for s in samples if not s["ok"]),
+            "min_ms": round(min(timings) / 1000, 2) if timings else None,
+            "median_ms": round(statistics.median(timings) / 1000, 2) if timings else None,
+            "heavy_imports": [m for m in heavy_imports if m not in missing],
+            "not_installed": missing,
+            "error": errors[0] if errors else None
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start import time of the entry points")
+    parser.add_argument("modules", nargs="*", default=ENTRY_POINTS)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", dest="json_file", help="Write the report to this file")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.modules, args.runs)
+
+    for module, stats in report.items():
+        print(f"{module}:")
+        print(f"  min: {stats['min_ms']} ms, median: {stats['median_ms']} ms ({stats['runs']} runs)")
+        print(f"  heavy imports at startup: {', '.join(stats['heavy_imports']) or 'none'}")
+        if stats["not_installed"]:
+            print(f"  not installed (deferral unverified): {', '.join(stats['not_installed'])}")
+        if stats["failed_runs"]:
+            print(f"  failed runs: {stats['failed_runs']} - {stats['error']}")
+
+    if args.json_file:
+        with open(args.json_file, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import hashlib
+import json
+import logging
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+CASSETTE_VERSION = 1
+
+MODE_LIVE = "live"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+CASSETTE_MODES = [MODE_LIVE, MODE_RECORD, MODE_REPLAY]
+
+SPEED_ORIGINAL = "original"
+SPEED_INSTANT = "instant"
+REPLAY_SPEEDS = [SPEED_ORIGINAL, SPEED_INSTANT]
+
+
+def prompt_fingerprint(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+
+
+def serialize_output(output: Any) -> Any:
+    if hasattr(output, "model_dump"):
+        return output.model_dump(mode="json")
+    if hasattr(output, "to_dict"):
+        return output.to_dict()
+    return output
+
+
+class Cassette:
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.exchanges: List[Dict[str, Any]] = []
+        self._pending: Dict[Tuple[str, str], deque] = defaultdict(deque)
+
+    @classmethod
+    def create(cls, path: str) -> "Cassette":
+        cassette = cls(path)
+        cassette.path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with open(cassette.path, 'w') as f:
+                f.write(json.dumps({"version": CASSETTE_VERSION}) + "\n")
+        except Exception as e:
+            logger.error(f"Error creating cassette at {cassette.path}: {str(e)}")
+            raise
+
+        return cassette
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        cassette = cls(path)
+        try:
+            with open(cassette.path, 'r') as f:
+                lines = [line for line in f if line.strip()]
+        except Exception as e:
+            logger.error(f"Error loading cassette from {cassette.path}: {str(e)}")
+            raise
+
+        header = json.loads(lines[0]) if lines else {}
+        if header.get("version") != CASSETTE_VERSION:
+            raise ValueError(
+                f"Unsupported cassette version {header.get('version')} in {cassette.path}"
+            )
+
+        for line in lines[1:]:
+            exchange = json.loads(line)
+            cassette.exchanges.append(exchange)
+            key = (exchange["processor"], exchange["prompt_hash"])
+            cassette._pending[key].append(exchange)
+
+        logger.info(f"Loaded {len(cassette.exchanges)} exchanges from {cassette.path}")
+        return cassette
+
+    def record(
+        self,
+        prompt: str,
+        processor: str,
+        run_id: Optional[str],
+        output: Any,
+        create_seconds: float,
+        result_seconds: float,
+        error: Optional[str] = None
+    ) -> None:
+        exchange = {
+            "processor": processor,
+            "prompt_hash": prompt_fingerprint(prompt),
+            "run_id": run_id,
+            "output": serialize_output(output),
+            "create_seconds": round(create_seconds, 3),
+            "result_seconds": round(result_seconds, 3),
+            "error": error
+        }
+        self.exchanges.append(exchange)
+
+        # One JSON line per exchange, so recording a long run stays linear
+        # and whatever finished before a crash is kept.
+        try:
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(exchange, separators=(",", ":")) + "\n")
+        except Exception as e:
+            logger.error(f"Error saving exchange to {self.path}: {str(e)}")
+            raise
+
+    def next_exchange(self, prompt: str, processor: str) -> Dict[str, Any]:
+        key = (processor, prompt_fingerprint(prompt))
+        pending = self._pending.get(key)
+        if not pending:
+            raise LookupError(
+                f"No recorded exchange for processor {processor} "
+                f"and prompt {key[1]} in {self.path}"
+            )
+        return pending.popleft()
@@ -1,11 +1,19 @@
 import asyncio
 import logging
 import os
-from dotenv import load_dotenv
+import time
 from typing import List, Dict, Any
-from parallel import Parallel
+from parallel_ai_testing.cassette import (
+    Cassette,
+    CASSETTE_MODES,
+    REPLAY_SPEEDS,
+    MODE_LIVE,
+    MODE_RECORD,
+    MODE_REPLAY,
+    SPEED_ORIGINAL,
+    serialize_output,
+)
 
-load_dotenv()
 logger = logging.getLogger(__name__)
 
 
@@ -29,13 +37,116 @@ DEEP_RESEARCH_PROCESSORS = [
     "ultra8x",
 ]
 
+DEFAULT_CASSETTE_PATH = "cassettes/parallel_cassette.jsonl"
+
 
 class ParallelAIClient:
-    def __init__(self, api_key: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        mode: str = None,
+        cassette_path: str = None,
+        replay_speed: str = None
+    ):
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
+        self.mode = mode or os.getenv("PARALLEL_CASSETTE_MODE", MODE_LIVE)
+        if self.mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode: {self.mode}")
+
+        self.replay_speed = replay_speed or os.getenv("PARALLEL_REPLAY_SPEED", SPEED_ORIGINAL)
+        if self.replay_speed not in REPLAY_SPEEDS:
+            raise ValueError(f"Unknown replay speed: {self.replay_speed}")
+
+        cassette_path = cassette_path or os.getenv("PARALLEL_CASSETTE_PATH", DEFAULT_CASSETTE_PATH)
+        self.cassette = None
+        self._client = None
+        self.api_key = None
+
+        if self.mode == MODE_REPLAY:
+            self.cassette = Cassette.load(cassette_path)
+            return
+
         self.api_key = api_key or os.getenv("PARALLEL_API_KEY")
         if not self.api_key:
             raise ValueError("PARALLEL_API_KEY must be set")
-        self.client = Parallel(api_key=self.api_key)
+
+        if self.mode == MODE_RECORD:
+            self.cassette = Cassette.create(cassette_path)
+            logger.info(f"Recording Parallel API exchanges to {cassette_path}")
+
+    @property
+    def client(self):
+        # The SDK is only imported and constructed on the first live request,
+        # keeping startup cheap for replay and planning-only runs.
+        if self.mode == MODE_REPLAY:
+            raise RuntimeError("The Parallel SDK client is not available in replay mode")
+        if self._client is None:
+            from parallel import Parallel
+
+            self._client = Parallel(api_key=self.api_key)
+        return self._client
+
+    def _run_task(self, prompt: str, processor: str):
+        started = time.monotonic()
+        create_seconds = 0.0
+        run_id = None
+        try:
+            task_run = self.client.task_run.create(
+                input=prompt,
+                processor=processor
+            )
+            run_id = task_run.run_id
+            create_seconds = time.monotonic() - started
+
+            logger.info(f"Task created with ID: {run_id} for {processor}")
+
+            run_result = self.client.task_run.result(
+                run_id,
+                api_timeout=3600
+            )
+        except Exception as e:
+            if self.mode == MODE_RECORD:
+                elapsed = time.monotonic() - started
+                if run_id is None:
+                    create_seconds = elapsed
+                self.cassette.record(
+                    prompt, processor, run_id, None,
+                    create_seconds,
+                    elapsed - create_seconds,
+                    error=str(e)
+                )
+            raise
+
+        output = serialize_output(run_result.output)
+
+        if self.mode == MODE_RECORD:
+            self.cassette.record(
+                prompt, processor, run_id, output,
+                create_seconds,
+                time.monotonic() - started - create_seconds
+            )
+
+        return run_id, output
+
+    def _replay_task(self, prompt: str, processor: str):
+        exchange = self.cassette.next_exchange(prompt, processor)
+
+        # The live SDK calls block the event loop, so original-speed replay
+        # blocks too in order to reproduce the same scheduling behaviour.
+        if self.replay_speed == SPEED_ORIGINAL:
+            time.sleep(exchange["create_seconds"])
+        if exchange["run_id"]:
+            logger.info(f"Task created with ID: {exchange['run_id']} for {processor}")
+        if self.replay_speed == SPEED_ORIGINAL:
+            time.sleep(exchange["result_seconds"])
+
+        if exchange.get("error"):
+            raise RuntimeError(exchange["error"])
+
+        return exchange["run_id"], exchange["output"]
     
     async def query_single_model(
         self, 
@@ -46,23 +157,16 @@ class ParallelAIClient:
         try:
             logger.info(f"Querying {processor} for brand: {brand}")
             
-            task_run = self.client.task_run.create(
-                input=prompt,
-                processor=processor
-            )
-            
-            logger.info(f"Task created with ID: {task_run.run_id} for {processor}")
-            
-            run_result = self.client.task_run.result(
-                task_run.run_id,
-                api_timeout=3600
-            )
+            if self.mode == MODE_REPLAY:
+                run_id, output = self._replay_task(prompt, processor)
+            else:
+                run_id, output = self._run_task(prompt, processor)
             
             return {
                 "brand": brand,
                 "processor": processor,
-                "run_id": task_run.run_id,
-                "output": run_result.output,
+                "run_id": run_id,
+                "output": output,
                 "status": "success"
             }
         except Exception as e:
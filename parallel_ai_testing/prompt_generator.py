@@ -1,7 +1,6 @@
-from parallel_ai_testing.query_parser import parse_search_term_to_text
-
-
 async def boolean_to_natural_language(boolean_query: str) -> str:
+    from parallel_ai_testing.query_parser import parse_search_term_to_text
+
     return await parse_search_term_to_text(boolean_query)
 
 
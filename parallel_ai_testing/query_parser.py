@@ -1,11 +1,12 @@
 import logging
-from lucene_query_parser import LuceneQueryParser
 
 logger = logging.getLogger(__name__)
 
 
 async def parse_search_term_to_text(search_term: str) -> str:
     try:
+        from lucene_query_parser import LuceneQueryParser
+
         parser = LuceneQueryParser()
         result = parser.parse(search_term)
         return result.narrative_text
@@ -0,0 +1,89 @@
+import asyncio
+import json
+import sys
+import types
+
+import pytest
+
+from parallel_ai_testing.cassette import Cassette
+
+
+class FakeTaskRun:
+    def create(self, input, processor):
+        return types.SimpleNamespace(run_id=f"run-{processor}")
+
+    def result(self, run_id, api_timeout):
+        if run_id == "run-ultra":
+            raise RuntimeError("processor failed")
+        return types.SimpleNamespace(output={"type": "json", "content": {"run_id": run_id}})
+
+
+@pytest.fixture(autouse=True)
+def stub_dependencies(monkeypatch):
+    dotenv = types.ModuleType("dotenv")
+    dotenv.load_dotenv = lambda: None
+    parallel = types.ModuleType("parallel")
+    parallel.Parallel = lambda api_key: types.SimpleNamespace(task_run=FakeTaskRun())
+    monkeypatch.setitem(sys.modules, "dotenv", dotenv)
+    monkeypatch.setitem(sys.modules, "parallel", parallel)
+
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    return str(tmp_path / "cassette.jsonl")
+
+
+def record(cassette_path, processors):
+    from parallel_ai_testing.parallel_client import ParallelAIClient
+
+    client = ParallelAIClient(api_key="test", mode="record", cassette_path=cassette_path)
+    return asyncio.run(client.query_all_models("prompt", "Brand", processors))
+
+
+def replay(cassette_path, processors, replay_speed="instant"):
+    from parallel_ai_testing.parallel_client import ParallelAIClient
+
+    client = ParallelAIClient(mode="replay", cassette_path=cassette_path, replay_speed=replay_speed)
+    return asyncio.run(client.query_all_models("prompt", "Brand", processors))
+
+
+def test_replay_matches_recording(cassette_path):
+    recorded = record(cassette_path, ["pro", "ultra", "pro"])
+    replayed = replay(cassette_path, ["pro", "ultra", "pro"])
+
+    assert replayed == recorded
+    assert replayed[0]["status"] == "success"
+    assert replayed[0]["output"] == {"type": "json", "content": {"run_id": "run-pro"}}
+    assert replayed[1]["status"] == "error"
+    assert replayed[1]["error"] == "processor failed"
+
+
+def test_missing_exchange_raises_lookup_error(cassette_path):
+    record(cassette_path, ["pro"])
+    cassette = Cassette.load(cassette_path)
+
+    cassette.next_exchange("prompt", "pro")
+    with pytest.raises(LookupError):
+        cassette.next_exchange("prompt", "pro")
+    with pytest.raises(LookupError):
+        cassette.next_exchange("other prompt", "pro")
+
+
+def test_instant_replay_does_not_sleep(cassette_path, monkeypatch):
+    record(cassette_path, ["pro"])
+
+    def fail_sleep(seconds):
+        raise AssertionError("instant replay must not sleep")
+
+    monkeypatch.setattr("parallel_ai_testing.parallel_client.time.sleep", fail_sleep)
+    results = replay(cassette_path, ["pro"])
+
+    assert results[0]["status"] == "success"
+
+
+def test_load_rejects_unknown_version(cassette_path):
+    with open(cassette_path, "w") as f:
+        f.write(json.dumps({"version": 999}) + "\n")
+
+    with pytest.raises(ValueError):
+        Cassette.load(cassette_path)